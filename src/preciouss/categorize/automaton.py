@@ -0,0 +1,107 @@
+"""Aho-Corasick keyword automaton for multi-keyword substring matching."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import ahocorasick  # optional C implementation (uv sync --extra fast)
+
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+# Sentinel rank for states that complete no keyword
+_NO_MATCH = 1 << 62
+
+
+class KeywordAutomaton:
+    """Match many keywords against a text in a single left-to-right pass.
+
+    Keywords are ranked by their position in the input iterable. `first()`
+    returns the lowest-ranked keyword that occurs anywhere in the text, which
+    is exactly what a linear `for kw in keywords: if kw in text` loop would
+    return — but without one substring scan per keyword.
+
+    When pyahocorasick is installed the scan runs in C; otherwise a pure-Python
+    automaton with the same results is used.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: list[str] = list(keywords)
+
+        # An empty keyword matches every text; the automata only track non-empty ones
+        self._empty_rank = next((r for r, kw in enumerate(self.keywords) if not kw), _NO_MATCH)
+
+        self._native: Any = None
+        if _HAS_AHOCORASICK and any(self.keywords):
+            self._native = self._build_native()
+        else:
+            self._build_python()
+
+    def _build_native(self) -> Any:
+        native = ahocorasick.Automaton()
+        for rank, keyword in enumerate(self.keywords):
+            # Keep the first (lowest) rank for duplicate keywords
+            if keyword and not native.exists(keyword):
+                native.add_word(keyword, rank)
+        native.make_automaton()
+        return native
+
+    def _build_python(self) -> None:
+        # goto[state] maps the next character → next state; state 0 is the root
+        self._goto: list[dict[str, int]] = [{}]
+        # rank[state] = lowest keyword rank completed at this state (incl. suffixes)
+        self._rank: list[int] = [_NO_MATCH]
+
+        for rank, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._rank.append(_NO_MATCH)
+                state = nxt
+            if rank < self._rank[state]:
+                self._rank[state] = rank
+
+        # Breadth-first pass: failure links, and fold each suffix's rank into the state
+        self._fail: list[int] = [0] * len(self._goto)
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target
+                if self._rank[target] < self._rank[nxt]:
+                    self._rank[nxt] = self._rank[target]
+                queue.append(nxt)
+
+    def first(self, text: str) -> int | None:
+        """Return the rank of the highest-priority keyword found in text, or None."""
+        best = self._empty_rank
+        if self._native is not None:
+            for _, rank in self._native.iter(text):
+                if rank < best:
+                    best = rank
+        else:
+            goto = self._goto
+            fail = self._fail
+            ranks = self._rank
+            state = 0
+            for ch in text:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+                if ranks[state] < best:
+                    best = ranks[state]
+        return best if best != _NO_MATCH else None
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 
+from preciouss.categorize.automaton import KeywordAutomaton
 from preciouss.importers.base import Transaction
 
-# Default keyword-to-category mapping
-# More specific keywords should come before generic ones
-DEFAULT_RULES: dict[str, str] = {
-    # JD platform categories (raw_category matching)
+# JD platform categories: matched exactly against tx.raw_category before any
+# keyword scan, and also kept as keywords (first in DEFAULT_RULES) for free text
+JD_RAW_CATEGORY_RULES: dict[str, str] = {
     "数码电器": "Expenses:Shopping:Electronics",
     "手机通讯": "Expenses:Shopping:Electronics",
     "电脑办公": "Expenses:Shopping:Electronics",
@@ -25,6 +29,12 @@ DEFAULT_RULES: dict[str, str] = {
     "运动户外": "Expenses:Health:Fitness",
     "医疗保健": "Expenses:Health:Medical",
     "生活服务": "Expenses:Shopping:DailyGoods",
+}
+
+# Default keyword-to-category mapping
+# More specific keywords should come before generic ones
+DEFAULT_RULES: dict[str, str] = {
+    **JD_RAW_CATEGORY_RULES,
     "12306": "Expenses:Transport:PublicTransit",
     "中国铁路网络": "Expenses:Transport:PublicTransit",
     "铁路": "Expenses:Transport:PublicTransit",
@@ -287,6 +297,40 @@ DEFAULT_REGEX_RULES: list[tuple[str, str]] = [
 ]
 
 
+def _compile_rule(pattern: str) -> re.Pattern[str]:
+    """Compile a regex rule for matching against already-lowercased text.
+
+    Lowercasing the pattern makes re.IGNORECASE unnecessary. Patterns with
+    escapes keep the flag instead, since lowercasing would change \\D, \\S, etc.
+    """
+    if "\\" in pattern:
+        return re.compile(pattern, re.IGNORECASE)
+    return re.compile(pattern.lower())
+
+
+def _combine_rules(patterns: list[re.Pattern[str]]) -> re.Pattern[str] | None:
+    """Union of all rule patterns as a single regex, or None if they cannot be merged.
+
+    Used as a one-pass prefilter: if the union does not match, no rule does.
+    Numbered backreferences would point at the wrong group once merged, and
+    leading inline flags or clashing group names fail to compile.
+    """
+    parts = []
+    for p in patterns:
+        if re.search(r"\\[1-9]", p.pattern):
+            return None
+        parts.append(f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+_COMPILED_DEFAULT_REGEX_RULES: list[tuple[re.Pattern[str], str]] = [
+    (_compile_rule(pattern), sys.intern(category)) for pattern, category in DEFAULT_REGEX_RULES
+]
+
+
 class RuleCategorizer:
     """Categorize transactions using keyword and regex rules."""
 
@@ -295,14 +339,41 @@ class RuleCategorizer:
         keyword_rules: dict[str, str] | None = None,
         regex_rules: list[tuple[str, str]] | None = None,
     ):
-        self.keyword_rules = {**DEFAULT_RULES}
+        self.keyword_rules: Mapping[str, str]
         if keyword_rules:
             # User rules override defaults
-            self.keyword_rules.update(keyword_rules)
+            self.keyword_rules = {**DEFAULT_RULES, **keyword_rules}
+        else:
+            # Read-only view: no per-instance copy of the ~250 default rules
+            self.keyword_rules = MappingProxyType(DEFAULT_RULES)
 
-        self.regex_rules = list(DEFAULT_REGEX_RULES)
+        # Category strings are interned (including config-loaded user categories), so
+        # the identical results returned for every transaction compare by identity
+        self.regex_rules: list[tuple[re.Pattern[str], str]] = list(_COMPILED_DEFAULT_REGEX_RULES)
         if regex_rules:
-            self.regex_rules = regex_rules + self.regex_rules
+            # User rules are tried before defaults
+            compiled = [(_compile_rule(p), sys.intern(cat)) for p, cat in regex_rules]
+            self.regex_rules = compiled + self.regex_rules
+        self._regex_prefilter = _combine_rules([p for p, _ in self.regex_rules])
+
+        # Exact raw_category lookups, honoring user overrides of the JD keywords
+        self._raw_category_rules = {
+            k: sys.intern(self.keyword_rules[k]) for k in JD_RAW_CATEGORY_RULES
+        }
+
+        # Single-pass keyword matcher; rank = position in keyword_rules (earlier wins).
+        # A keyword that contains an earlier keyword (e.g. "万科物业" after "物业") can
+        # never win, so shadowed keywords and duplicates are dropped from the automaton.
+        keywords = [kw.lower() for kw in self.keyword_rules]
+        categories = [sys.intern(cat) for cat in self.keyword_rules.values()]
+        full = KeywordAutomaton(keywords)
+        live = [i for i, kw in enumerate(keywords) if full.first(kw) == i]
+        self._keyword_categories = [categories[i] for i in live]
+        self._automaton = KeywordAutomaton(keywords[i] for i in live)
+
+        # Identical texts recur heavily across imports (same merchant, same item),
+        # so memoize the rule scan per categorizer instance.
+        self._cached_match = functools.lru_cache(maxsize=4096)(self._match)
 
     @staticmethod
     def _direction_account(category: str, tx_type: str | None) -> str:
@@ -311,20 +382,60 @@ class RuleCategorizer:
             return "Income:Transfer"
         return category
 
-    def categorize(self, tx: Transaction) -> str | None:
-        """Try to categorize a transaction. Returns account name or None."""
-        text = f"{tx.payee} {tx.narration}".lower()
+    @staticmethod
+    def _match_text(tx: Transaction) -> str:
+        """Build the lowercased text that keyword and regex rules are matched against."""
         if tx.raw_category:
-            text += f" {tx.raw_category}".lower()
+            return f"{tx.payee} {tx.narration} {tx.raw_category}".lower()
+        return f"{tx.payee} {tx.narration}".lower()
 
-        # Try keyword matching first (exact substring)
-        for keyword, category in self.keyword_rules.items():
-            if keyword.lower() in text:
-                return self._direction_account(category, tx.tx_type)
+    def _match(self, text: str) -> str | None:
+        """Return the category of the first matching rule, before direction flipping."""
+        # Try keyword matching first (exact substring, first rule in order wins)
+        rank = self._automaton.first(text)
+        if rank is not None:
+            return self._keyword_categories[rank]
 
-        # Try regex matching
+        # Try regex matching: one combined scan settles the common no-match case,
+        # then rules are tried in order so the first matching rule still wins
+        if self._regex_prefilter is not None and not self._regex_prefilter.search(text):
+            return None
         for pattern, category in self.regex_rules:
-            if re.search(pattern, text, re.IGNORECASE):
-                return self._direction_account(category, tx.tx_type)
+            if pattern.search(text):
+                return category
 
         return None
+
+    def _lookup(self, tx: Transaction) -> str | None:
+        """Exact platform category first, then the (memoized) rule scan."""
+        if tx.raw_category:
+            category = self._raw_category_rules.get(tx.raw_category)
+            if category is not None:
+                return category
+        return self._cached_match(self._match_text(tx))
+
+    def categorize(self, tx: Transaction) -> str | None:
+        """Try to categorize a transaction. Returns account name or None."""
+        category = self._lookup(tx)
+        if category is None:
+            return None
+        return self._direction_account(category, tx.tx_type)
+
+    def categorize_batch(self, transactions: Iterable[Transaction]) -> list[str | None]:
+        """Categorize many transactions at once, matching each distinct text only once.
+
+        Bank and platform exports repeat the same payee/narration many times
+        (e.g. daily coffee), so repeated fields skip both text building and the scan.
+        """
+        matched: dict[tuple[str, str, str | None], str | None] = {}
+        results: list[str | None] = []
+        for tx in transactions:
+            key = (tx.payee, tx.narration, tx.raw_category)
+            if key in matched:
+                category = matched[key]
+            else:
+                category = matched[key] = self._lookup(tx)
+            results.append(
+                None if category is None else self._direction_account(category, tx.tx_type)
+            )
+        return results
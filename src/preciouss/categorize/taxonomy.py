@@ -64,11 +64,13 @@ INCOME_TAXONOMY: dict[str, str] = {
 }
 
 
+# Flat views built once at import (the taxonomy is static)
+EXPENSE_CATEGORIES: tuple[str, ...] = tuple(
+    f"{parent}:{child}" for parent, children in EXPENSE_TAXONOMY.items() for child in children
+)
+ALL_CATEGORIES: tuple[str, ...] = EXPENSE_CATEGORIES + tuple(INCOME_TAXONOMY)
+
+
 def get_all_categories() -> list[str]:
     """Return a flat list of all category account names."""
-    categories = []
-    for parent, children in EXPENSE_TAXONOMY.items():
-        for child in children:
-            categories.append(f"{parent}:{child}")
-    categories.extend(INCOME_TAXONOMY.keys())
-    return categories
+    return list(ALL_CATEGORIES)
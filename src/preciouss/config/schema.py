@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import tomllib
 from pathlib import Path
 from typing import Any
@@ -65,15 +67,26 @@ class Config(BaseModel):
         return self.categorize.get("rules", {})
 
 
+_ENV_VAR_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def _env_var_value(match: re.Match[str]) -> str:
+    # Unset variables are left as the literal ${NAME}
+    return os.environ.get(match.group(1), match.group(0))
+
+
 def _resolve_env_vars(data: dict) -> dict:
-    """Recursively resolve ${ENV_VAR} references in string values."""
+    """Recursively resolve ${ENV_VAR} references in string values.
+
+    References may appear anywhere in a string (e.g. "${HOME}/ledger"). A new
+    tree is returned; the input, which may be a cached parse, is not modified.
+    """
     resolved = {}
     for key, value in data.items():
         if isinstance(value, dict):
             resolved[key] = _resolve_env_vars(value)
-        elif isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-            env_var = value[2:-1]
-            resolved[key] = os.environ.get(env_var, value)
+        elif isinstance(value, str) and "${" in value:
+            resolved[key] = _ENV_VAR_RE.sub(_env_var_value, value)
         else:
             resolved[key] = value
     return resolved
@@ -94,11 +107,25 @@ def load_config(config_path: str | Path | None = None) -> Config:
     else:
         config_path = Path(config_path)
 
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         return Config()
 
-    with open(config_path, "rb") as f:
-        raw = tomllib.load(f)
+    raw = _read_toml(str(config_path), st.st_mtime_ns, st.st_size)
 
+    # Env vars are resolved on every load so changes to the environment still apply
     raw = _resolve_env_vars(raw)
     return Config.model_validate(raw)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_toml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a TOML file, memoized on its path, mtime and size.
+
+    Repeated loads of an unchanged file in the same process skip the read and
+    parse; editing the file changes the key. The result is shared, so callers
+    must not mutate it.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
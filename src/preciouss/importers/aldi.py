@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import mmap
 import re
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
+try:
+    import orjson  # optional fast JSON parser (uv sync --extra fast)
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+from preciouss.categorize.automaton import KeywordAutomaton
 from preciouss.importers.base import PrecioussImporter, Transaction
 
 # Keyword patterns → expense account mapping for individual items
@@ -61,13 +71,42 @@ ALDI_ITEM_CATEGORIES: list[tuple[re.Pattern[str], str]] = [
 DEFAULT_ALDI_CATEGORY = "Expenses:Food:Grocery"
 
 
+@functools.cache
+def _item_keyword_automaton() -> tuple[KeywordAutomaton, list[str]] | None:
+    """Build the shared item automaton and its rank → account list, once per process.
+
+    When every pattern is a plain alternation of literal keywords, flatten them in
+    priority order into one automaton: a single pass over the item name finds the
+    earliest pattern with any matching keyword. Returns None if any pattern uses
+    other regex syntax, in which case the patterns are matched one by one.
+    """
+    keywords: list[str] = []
+    accounts: list[str] = []
+    for pattern, account in ALDI_ITEM_CATEGORIES:
+        for keyword in pattern.pattern.split("|"):
+            if not keyword or re.escape(keyword) != keyword:
+                return None
+            keywords.append(keyword)
+            accounts.append(account)
+    return KeywordAutomaton(keywords), accounts
+
+
 class AldiItemCategorizer:
     """Categorize individual ALDI product items by keyword matching."""
 
+    def __init__(self):
+        self._keyword_index = _item_keyword_automaton()
+
     def categorize(self, item_name: str) -> str:
-        for pattern, account in ALDI_ITEM_CATEGORIES:
-            if pattern.search(item_name):
-                return account
+        if self._keyword_index is None:
+            for pattern, account in ALDI_ITEM_CATEGORIES:
+                if pattern.search(item_name):
+                    return account
+            return DEFAULT_ALDI_CATEGORY
+        automaton, accounts = self._keyword_index
+        rank = automaton.first(item_name)
+        if rank is not None:
+            return accounts[rank]
         return DEFAULT_ALDI_CATEGORY
 
 
@@ -99,8 +138,17 @@ class AldiImporter(PrecioussImporter):
         if filepath.suffix.lower() != ".json":
             return False
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                # Every ALDI order carries an "orderCode" key: look for it in the mapped
+                # file (no copy, no decode) so other JSON exports skip the full parse
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'"orderCode"') < 0:
+                        return False
+                raw = f.read()
+            # identify only inspects structure, so floats are fine and orjson can be used.
+            # Decode strictly as UTF-8 like extract() (and orjson): json.loads on bytes
+            # would also accept a BOM or UTF-16/32 that extract() then rejects
+            data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw.decode("utf-8"))
             if not isinstance(data, dict) or "orders" not in data:
                 return False
             orders = data["orders"]
@@ -119,7 +167,8 @@ class AldiImporter(PrecioussImporter):
     def extract(self, filepath: str | Path) -> list[Transaction]:
         filepath = Path(filepath)
         with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+            # Parse prices as Decimal straight from the JSON text (no float round-trip)
+            data = json.load(f, parse_float=Decimal)
 
         transactions = []
         for order in data["orders"]:
@@ -146,12 +195,12 @@ class AldiImporter(PrecioussImporter):
         metadata: dict = {"aldi_items": categorized_items}
         if order.get("channel"):
             metadata["aldi_channel"] = order["channel"]
-        promotion = Decimal(str(order.get("promotionAmount", 0)))
+        promotion = Decimal(order.get("promotionAmount", 0))
         if promotion:
             metadata["aldi_discount"] = str(promotion)
 
         dt = datetime.strptime(f"{order['date']} {order['time']}", "%Y-%m-%d %H:%M")
-        payment_amount = Decimal(str(order["paymentAmount"]))
+        payment_amount = Decimal(order["paymentAmount"])
 
         return Transaction(
             date=dt,
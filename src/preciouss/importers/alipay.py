@@ -8,6 +8,40 @@ from decimal import Decimal, InvalidOperation
 from preciouss.importers.base import CsvImporter, Transaction
 from preciouss.importers.clearing import detect_merchant_clearing, resolve_payment_to_clearing
 
+_ACCEPTED_STATUS = frozenset({"交易成功", "退款成功", "还款成功"})
+
+# 收/支 → (sign applied to the absolute amount, tx_type); 0 keeps the amount as-is
+_DIRECTIONS: dict[str, tuple[int, str]] = {
+    "支出": (-1, "expense"),
+    "收入": (1, "income"),
+    "不计收支": (0, "transfer"),
+}
+
+
+def _parse_datetime(value: str) -> datetime | None:
+    """Parse an Alipay timestamp ("YYYY-MM-DD HH:MM:SS" or "YYYY/MM/DD HH:MM:SS").
+
+    The fixed-width layout every export uses goes through the C-level
+    fromisoformat; anything else falls back to strptime with both formats.
+    """
+    if (
+        len(value) == 19
+        and value[4] == value[7]
+        and value[4] in "-/"
+        and value[10] == " "
+        and value[13] == value[16] == ":"
+    ):
+        try:
+            return datetime.fromisoformat(value.replace("/", "-"))
+        except ValueError:
+            pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 class AlipayImporter(CsvImporter):
     """Import transactions from Alipay CSV exports.
@@ -41,7 +75,7 @@ class AlipayImporter(CsvImporter):
         try:
             content = self._read_file(filepath)
             # Only match header area (first 3 lines), not data rows
-            first_lines = "\n".join(content.split("\n")[:3])
+            first_lines = "\n".join(content.split("\n", 3)[:3])
             return "支付宝交易记录" in first_lines
         except Exception:
             return False
@@ -55,7 +89,7 @@ class AlipayImporter(CsvImporter):
 
         # Parse transaction status - skip non-completed transactions
         status = row.get("交易状态", "").strip()
-        if status not in ("交易成功", "退款成功", "还款成功"):
+        if status not in _ACCEPTED_STATUS:
             return None
 
         # Parse amount
@@ -66,27 +100,15 @@ class AlipayImporter(CsvImporter):
             return None
 
         # Determine direction (income/expense)
-        direction = row.get("收/支", "").strip()
-        if direction == "支出":
-            amount = -abs(amount)
-            tx_type = "expense"
-        elif direction == "收入":
-            amount = abs(amount)
-            tx_type = "income"
-        elif direction == "不计收支":
-            tx_type = "transfer"
-        else:
-            tx_type = "other"
+        sign, tx_type = _DIRECTIONS.get(row.get("收/支", "").strip(), (0, "other"))
+        if sign:
+            amount = sign * abs(amount)
 
         # Parse date
         date_str = row.get("付款时间", row.get("交易创建时间", "")).strip()
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-        except (ValueError, TypeError):
-            try:
-                date = datetime.strptime(date_str, "%Y/%m/%d %H:%M:%S")
-            except (ValueError, TypeError):
-                return None
+        date = _parse_datetime(date_str)
+        if date is None:
+            return None
 
         payee = row.get("交易对方", "").strip()
         narration = row.get("商品名称", "").strip()
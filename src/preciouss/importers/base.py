@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import functools
 import io
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -10,15 +11,17 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 
-import chardet
+from chardet import UniversalDetector
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """Intermediate transaction model used across all importers.
 
     This is NOT a beancount Transaction - it's our internal representation
     that gets converted to beancount entries by the ledger writer.
+
+    Slotted: imports create one per CSV row, so instances carry no __dict__.
     """
 
     date: datetime
@@ -115,9 +118,9 @@ class CsvImporter(PrecioussImporter):
 
         try:
             content = self._read_file(filepath)
-            # Check first few lines for expected headers
-            lines = content.split("\n")[: self.skip_lines + 5]
-            header_area = "\n".join(lines)
+            # Check first few lines for expected headers (split off just those lines)
+            n_lines = self.skip_lines + 5
+            header_area = "\n".join(content.split("\n", n_lines)[:n_lines])
             return all(kw in header_area for kw in self.expected_headers)
         except Exception:
             return False
@@ -127,20 +130,35 @@ class CsvImporter(PrecioussImporter):
         filepath = Path(filepath)
         content = self._read_file(filepath)
 
-        # Skip leading lines (some platforms add metadata before the header)
-        lines = content.split("\n")
-        csv_lines = lines[self.skip_lines :]
+        # Skip leading lines (some platforms add metadata before the header) by slicing
+        # past the Nth newline rather than splitting the whole file into lines
+        start = 0
+        for _ in range(self.skip_lines):
+            newline = content.find("\n", start)
+            if newline < 0:
+                start = len(content)
+                break
+            start = newline + 1
+        csv_content = content[start:]
 
         if self.tab_delimited:
-            csv_lines = [line.replace("\t,", ",").replace("\t", "") for line in csv_lines]
+            # Replacing "\t," with "," and then dropping "\t" just removes every tab
+            csv_content = csv_content.replace("\t", "")
 
-        csv_content = "\n".join(csv_lines)
+        reader = csv.reader(io.StringIO(csv_content), delimiter=self.delimiter)
+        header = next(reader, None)
+        if header is None:
+            return []
+        # Strip header names once; rows are then keyed by column position
+        columns = [(i, name.strip()) for i, name in enumerate(header) if name]
 
-        reader = csv.DictReader(io.StringIO(csv_content), delimiter=self.delimiter)
         transactions = []
-        for row in reader:
-            # Strip whitespace from keys and values
-            row = {k.strip(): v.strip() if v else "" for k, v in row.items() if k}
+        for values in reader:
+            if not values:
+                continue  # blank line
+            # Strip whitespace from values; short rows get "" for the missing columns
+            n = len(values)
+            row = {name: values[i].strip() if i < n else "" for i, name in columns}
             tx = self._parse_row(row)
             if tx is not None:
                 transactions.append(tx)
@@ -162,15 +180,67 @@ class CsvImporter(PrecioussImporter):
 
     def _read_file(self, filepath: Path) -> str:
         """Read file with automatic encoding detection."""
-        raw = filepath.read_bytes()
-        detected = chardet.detect(raw)
-        encoding = detected.get("encoding", "utf-8")
-
-        # Common Chinese CSV encodings
-        for enc in [encoding, "utf-8-sig", "gb18030", "gbk", "utf-8"]:
-            try:
-                return raw.decode(enc)
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        return raw.decode("utf-8", errors="replace")
+        st = filepath.stat()
+        return _decode_file(str(filepath), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read and decode a text file, memoized on its path, mtime and size.
+
+    Every CSV importer's identify() reads the candidate file, and extract() reads
+    it once more; sharing the decoded text means each file is read and run
+    through encoding detection once rather than once per importer.
+
+    The cache holds up to 8 files, matching the at most 8 files `preciouss
+    import` reads at once; a rewritten file gets a new mtime or size and so a
+    new entry.
+    """
+    raw = Path(path).read_bytes()
+    encoding = _detect_encoding(raw) or "utf-8"
+
+    # Common Chinese CSV encodings
+    for enc in [encoding, "utf-8-sig", "gb18030", "gbk", "utf-8"]:
+        try:
+            return raw.decode(enc)
+        except (UnicodeDecodeError, LookupError):
+            continue
+
+    return raw.decode("utf-8", errors="replace")
+
+
+# Bytes fed to the encoding detector per step
+_DETECT_CHUNK = 8192
+
+# Byte-order marks, longest first (the UTF-32 LE mark starts with the UTF-16 LE one)
+_BOMS = (
+    (b"\xef\xbb\xbf", "UTF-8-SIG"),
+    (b"\xff\xfe\x00\x00", "UTF-32"),
+    (b"\x00\x00\xfe\xff", "UTF-32"),
+    (b"\xff\xfe", "UTF-16"),
+    (b"\xfe\xff", "UTF-16"),
+)
+
+
+def _detect_encoding(raw: bytes) -> str | None:
+    """Guess the encoding of raw, feeding chardet incrementally.
+
+    BOM-marked and plain-ASCII input is recognized up front. Otherwise the
+    detector is fed fixed-size chunks and stops as soon as it is confident, so a
+    large statement is usually decided from its first few KB instead of being
+    run through chardet's state machines in full.
+    """
+    # Trivially decidable cases, answered the way chardet would without running it
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+    if raw.isascii() and b"\x1b" not in raw and b"~{" not in raw:
+        # chardet only looks further at pure ASCII for ISO-2022 escapes / HZ markers
+        return "ascii"
+
+    detector = UniversalDetector()
+    for start in range(0, len(raw), _DETECT_CHUNK):
+        detector.feed(raw[start : start + _DETECT_CHUNK])
+        if detector.done:
+            break
+    return detector.close()["encoding"]
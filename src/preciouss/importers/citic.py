@@ -9,10 +9,17 @@ Each billing cycle spans ~2 pages:
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import re
-from collections import defaultdict
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from preciouss.importers.base import PrecioussImporter, Transaction
@@ -30,8 +37,6 @@ _CNY_BALANCE_RE = re.compile(
 # Also handles inline: "账单日 Statement Date  2026-01-08"
 _STATEMENT_DATE_RE = re.compile(r"账单日\D{0,30}?(\d{4}-\d{2}-\d{2})")
 
-# Transaction date: 8-digit YYYYMMDD (new format) or YYYY-MM-DD (old format pre-2023)
-_DATE_TX_RE = re.compile(r"^\d{8}$|^\d{4}-\d{2}-\d{2}$")
 
 # CITIC PDF column x-boundaries — unified across both PDF generations:
 #   New (2024+): YYYYMMDD, tx_date~8, post_date~74, card4~159, desc~214, tx_amt~370, setl~482
@@ -47,11 +52,106 @@ _CITIC_COLS = [
 ]
 
 
-def _citic_col_of(x0: float) -> str | None:
-    for name, lo, hi in _CITIC_COLS:
-        if lo <= x0 < hi:
-            return name
-    return None
+# Columns are contiguous and sorted, so a word's column is found by bisecting left edges
+_CITIC_LEFT_EDGES = [lo for _, lo, _ in _CITIC_COLS]
+_CITIC_RIGHT_EDGE = _CITIC_COLS[-1][2]
+
+# Statements shorter than this are read in-process; worker start-up would dominate
+_PARALLEL_MIN_PAGES = 4
+
+# Workers are never forked: `preciouss import` reads files on a thread pool, and
+# a child forked from a multi-threaded process can inherit a held import lock
+_MP_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Held while a statement is read on a process pool, so concurrent extracts do not
+# each start up to one worker per CPU
+_PARALLEL_LOCK = threading.Lock()
+
+
+def _citic_col_index(x0: float) -> int | None:
+    """Index into _CITIC_COLS of the column containing x0, or None if outside the table."""
+    i = bisect_right(_CITIC_LEFT_EDGES, x0) - 1
+    if i < 0 or x0 >= _CITIC_RIGHT_EDGE:
+        return None
+    return i
+
+
+def _is_tx_date(t: str) -> bool:
+    """Transaction date: 8-digit YYYYMMDD (new format) or YYYY-MM-DD (old format pre-2023).
+
+    Checked with length and str.isdecimal tests rather than a regex; this runs
+    once per word in the tx_date column of every page.
+    """
+    n = len(t)
+    if n == 8:
+        return t.isdecimal()
+    return (
+        n == 10
+        and t[4] == "-"
+        and t[7] == "-"
+        and t[:4].isdecimal()
+        and t[5:7].isdecimal()
+        and t[8:].isdecimal()
+    )
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (honours affinity masks where the OS exposes them)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        return os.cpu_count() or 1
+
+
+def _read_pages_parallel(pdf_path: str, n_pages: int, n_workers: int) -> list[dict]:
+    """Read all pages on n_workers processes, one contiguous run of pages each.
+
+    Pages are independent and pdfminer layout analysis is CPU-bound; each worker
+    opens the PDF once, and map() keeps the runs in page order.
+    """
+    bounds = [n_pages * i // n_workers for i in range(n_workers + 1)]
+    with ProcessPoolExecutor(
+        max_workers=n_workers, mp_context=multiprocessing.get_context(_MP_START_METHOD)
+    ) as pool:
+        chunks = pool.map(_extract_pages_payload, [pdf_path] * n_workers, bounds[:-1], bounds[1:])
+        return [page for chunk in chunks for page in chunk]
+
+
+def _extract_pages_payload(pdf_path: str, start: int, stop: int) -> list[dict]:
+    """Open the PDF and return {text, table} for pages [start, stop) (worker entry)."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_page_payload(page) for page in pdf.pages[start:stop]]
+
+
+def _page_payload(page) -> dict:
+    """Return {text, table} for one pdfplumber page."""
+    text = page.extract_text() or ""
+    words = page.extract_words()
+
+    # Collect (row, column, text) for every word in the table, with rows keyed by
+    # top rounded to the nearest 4 pts; a stable sort on the row key groups them
+    # while keeping each row's words in page order
+    entries: list[tuple[int, int, str]] = []
+    for w in words:
+        col = _citic_col_index(w["x0"])
+        if col is not None:
+            entries.append((round(w["top"] / 4) * 4, col, w["text"]))
+    entries.sort(key=itemgetter(0))
+
+    # Extract transaction rows: rows that have a transaction date in tx_date col
+    table_rows: list[list[str]] = []
+    for _, row_entries in groupby(entries, key=itemgetter(0)):
+        cells: list[list[str]] = [[] for _ in _CITIC_COLS]
+        for _, col, word in row_entries:
+            cells[col].append(word)
+        if any(_is_tx_date(t) for t in cells[0]):
+            table_rows.append([" ".join(cell) for cell in cells])
+
+    return {"text": text, "table": table_rows}
 
 
 def _parse_amount(s: str) -> Decimal | None:
@@ -128,40 +228,33 @@ class CiticCreditPdfImporter(PrecioussImporter):
         Uses coordinate-based word extraction because the CITIC transaction
         table has no visible borders that pdfplumber can detect.  Words are
         grouped by row (Y position) and assigned to columns by X position.
+
+        Statements of _PARALLEL_MIN_PAGES or more pages are read in worker
+        processes when more than one CPU is available. Workers are started with
+        forkserver/spawn, which re-import the caller's main module: scripts that
+        call this importer must keep their entry point under an
+        ``if __name__ == "__main__":`` guard. If the pool cannot start or breaks,
+        the pages are read serially instead.
         """
         import pdfplumber
 
-        pages = []
         with pdfplumber.open(filepath) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                words = page.extract_words()
-
-                # Group words by approximate row (round top to nearest 4 pts)
-                row_groups: dict = defaultdict(lambda: defaultdict(list))
-                for w in words:
-                    key = round(w["top"] / 4) * 4
-                    col = _citic_col_of(w["x0"])
-                    if col:
-                        row_groups[key][col].append(w["text"])
-
-                # Extract transaction rows: rows that have a transaction date in tx_date col
-                table_rows: list[list[str]] = []
-                for key in sorted(row_groups.keys()):
-                    row = row_groups[key]
-                    if any(_DATE_TX_RE.match(t) for t in row.get("tx_date", [])):
-                        table_rows.append([
-                            " ".join(row.get("tx_date", [])),
-                            " ".join(row.get("post_date", [])),
-                            " ".join(row.get("card4", [])),
-                            " ".join(row.get("desc", [])),
-                            " ".join(row.get("tx_amt", [])),
-                            " ".join(row.get("setl_amt", [])),
-                        ])
-
-                pages.append({"text": text, "table": table_rows})
-
-        return pages
+            n_pages = len(pdf.pages)
+            n_workers = min(_available_cpus(), n_pages) if n_pages >= _PARALLEL_MIN_PAGES else 1
+            # Only one statement at a time uses a process pool: `preciouss import`
+            # already extracts several files concurrently on its thread pool
+            if n_workers < 2 or not _PARALLEL_LOCK.acquire(blocking=False):
+                return [_page_payload(page) for page in pdf.pages]
+
+        try:
+            return _read_pages_parallel(str(filepath), n_pages, n_workers)
+        except (OSError, BrokenProcessPool):
+            logger.warning(
+                "Parallel read of %s failed; reading pages serially", filepath, exc_info=True
+            )
+        finally:
+            _PARALLEL_LOCK.release()
+        return _extract_pages_payload(str(filepath), 0, n_pages)
 
     @classmethod
     def _parse(
@@ -7,9 +7,15 @@ clearing accounts bridge cross-source transactions.
 
 from __future__ import annotations
 
+import functools
+
+from preciouss.categorize.automaton import KeywordAutomaton
 from preciouss.importers.resolve import BANK_PATTERNS
 
 # --- Merchant clearing configuration ---
+#
+# The tables below are read into cached automata and memoized lookups on first
+# use; code that edits them at runtime must call cache_clear() on those caches.
 
 # Known merchants: name → has_sub_clearing (whether to subdivide by payment platform)
 CLEARING_MERCHANTS: dict[str, bool] = {
@@ -47,23 +53,75 @@ PLATFORM_INTERNAL_ACCOUNTS: dict[str, dict[str, str]] = {
 }
 
 
+@functools.cache
+def _merchant_keyword_automaton() -> tuple[KeywordAutomaton, list[str]]:
+    """Build the lowercased merchant keyword automaton and its rank → merchant list, once.
+
+    Keywords are flattened in MERCHANT_KEYWORDS order, so the lowest matching
+    rank belongs to the first merchant with any keyword in the text.
+    """
+    keywords: list[str] = []
+    merchants: list[str] = []
+    for merchant, merchant_keywords in MERCHANT_KEYWORDS.items():
+        for keyword in merchant_keywords:
+            keywords.append(keyword.lower())
+            merchants.append(merchant)
+    return KeywordAutomaton(keywords), merchants
+
+
+@functools.cache
+def _channel_keyword_automaton() -> tuple[KeywordAutomaton, list[str]]:
+    """Build the PLATFORM_IDENTIFIERS automaton and its rank → channel code list, once."""
+    keywords: list[str] = []
+    channels: list[str] = []
+    for channel_code, channel_keywords in PLATFORM_IDENTIFIERS.items():
+        keywords.extend(channel_keywords)
+        channels.extend([channel_code] * len(channel_keywords))
+    return KeywordAutomaton(keywords), channels
+
+
+@functools.cache
+def _bank_automaton() -> tuple[KeywordAutomaton, list[str]]:
+    """Build the BANK_PATTERNS automaton and its rank → bank code list, once."""
+    return KeywordAutomaton(BANK_PATTERNS), list(BANK_PATTERNS.values())
+
+
+@functools.cache
+def _internal_accounts_longest_first(platform: str) -> tuple[tuple[str, str], ...]:
+    """PLATFORM_INTERNAL_ACCOUNTS entries for platform, longest keyword first, sorted once."""
+    internal = PLATFORM_INTERNAL_ACCOUNTS.get(platform, {})
+    return tuple(sorted(internal.items(), key=lambda x: -len(x[0])))
+
+
+def _find_channel(text: str) -> str | None:
+    """Return the first PLATFORM_IDENTIFIERS channel with a keyword in text, or None."""
+    automaton, channels = _channel_keyword_automaton()
+    rank = automaton.first(text)
+    return channels[rank] if rank is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
 def detect_merchant_clearing(my_platform: str, payee: str, narration: str) -> str | None:
     """Detect known merchant → clearing account.
 
     If the merchant has sub-clearing → Assets:Clearing:<MERCHANT>:<MY_PLATFORM>
     If the merchant has no sub-clearing → Assets:Clearing:<MERCHANT>
     If not a known merchant → None (use categorizer)
-    """
-    text = f"{payee} {narration}".lower()
-    for merchant, keywords in MERCHANT_KEYWORDS.items():
-        if any(kw.lower() in text for kw in keywords):
-            has_sub = CLEARING_MERCHANTS.get(merchant, False)
-            if has_sub:
-                return f"Assets:Clearing:{merchant}:{my_platform}"
-            return f"Assets:Clearing:{merchant}"
-    return None
-
 
+    Memoized: payees and narrations repeat heavily across a statement.
+    """
+    automaton, merchants = _merchant_keyword_automaton()
+    rank = automaton.first(f"{payee} {narration}".lower())
+    if rank is None:
+        return None
+    merchant = merchants[rank]
+    has_sub = CLEARING_MERCHANTS.get(merchant, False)
+    if has_sub:
+        return f"Assets:Clearing:{merchant}:{my_platform}"
+    return f"Assets:Clearing:{merchant}"
+
+
+@functools.lru_cache(maxsize=4096)
 def resolve_payment_to_clearing(payment_method: str, platform: str) -> str:
     """Resolve payment method string → clearing account. Shared logic for all platforms.
 
@@ -74,14 +132,15 @@ def resolve_payment_to_clearing(payment_method: str, platform: str) -> str:
     4. Credit card → Assets:Clearing:<MY>:CC:<BANK>
     5. Debit card → Assets:Clearing:<MY>:Bank:<BANK>
     6. Fallback → Assets:Clearing:<MY>:Unknown
+
+    Memoized: a ledger uses only a handful of distinct payment method strings.
     """
     method = payment_method.strip()
     if not method or method == "/":
         return f"Assets:Clearing:{platform}:Unknown"
 
     # 1. Platform-internal accounts (longest match first)
-    internal = PLATFORM_INTERNAL_ACCOUNTS.get(platform, {})
-    for keyword, account in sorted(internal.items(), key=lambda x: -len(x[0])):
+    for keyword, account in _internal_accounts_longest_first(platform):
         if method.startswith(keyword):
             return account
 
@@ -90,16 +149,16 @@ def resolve_payment_to_clearing(payment_method: str, platform: str) -> str:
         parts = method.split("-", 1)
         prefix = parts[0].strip()
         # Check if prefix is a known platform
-        for channel_code, keywords in PLATFORM_IDENTIFIERS.items():
-            if any(kw in prefix for kw in keywords):
-                return f"Assets:Clearing:{platform}:{channel_code}"
+        channel_code = _find_channel(prefix)
+        if channel_code is not None:
+            return f"Assets:Clearing:{platform}:{channel_code}"
         # If prefix is not a platform, try resolving the part after "-"
         return resolve_payment_to_clearing(parts[1], platform)
 
     # 3. Known platform keywords
-    for channel_code, keywords in PLATFORM_IDENTIFIERS.items():
-        if any(kw in method for kw in keywords):
-            return f"Assets:Clearing:{platform}:{channel_code}"
+    channel_code = _find_channel(method)
+    if channel_code is not None:
+        return f"Assets:Clearing:{platform}:{channel_code}"
 
     # 4/5. Bank card detection
     if "储蓄卡" in method:
@@ -109,9 +168,10 @@ def resolve_payment_to_clearing(payment_method: str, platform: str) -> str:
     else:
         card_prefix = "CC"  # default to credit card
 
-    for bank_name, bank_code in BANK_PATTERNS.items():
-        if bank_name in method:
-            return f"Assets:Clearing:{platform}:{card_prefix}:{bank_code}"
+    automaton, bank_codes = _bank_automaton()
+    rank = automaton.first(method)
+    if rank is not None:
+        return f"Assets:Clearing:{platform}:{card_prefix}:{bank_codes[rank]}"
 
     # 6. Fallback
     return f"Assets:Clearing:{platform}:Unknown"
@@ -136,7 +136,7 @@ class JdImporter(CsvImporter):
         try:
             content = self._read_file(filepath)
             # Check first few lines for "京东账号名"
-            first_lines = "\n".join(content.split("\n")[:5])
+            first_lines = "\n".join(content.split("\n", 5)[:5])
             return "京东账号名" in first_lines
         except Exception:
             return False
@@ -38,11 +38,13 @@ WALLET_ACCOUNTS: dict[str, str] = {
 }
 
 # Platform accounts that may need cross-platform resolution
-PLATFORM_ACCOUNT_PREFIXES: set[str] = {
-    "Assets:WeChat",
-    "Assets:Alipay",
-    "Assets:JD",
-}
+PLATFORM_ACCOUNT_PREFIXES: frozenset[str] = frozenset(
+    {
+        "Assets:WeChat",
+        "Assets:Alipay",
+        "Assets:JD",
+    }
+)
 
 # Keywords used to identify platform transactions in other platforms' data
 PLATFORM_KEYWORDS: dict[str, list[str]] = {
@@ -76,7 +76,7 @@ class WechatImporter(CsvImporter):
     def _identify_csv(self, filepath: Path) -> bool:
         try:
             content = self._read_file(filepath)
-            first_line = content.split("\n")[0]
+            first_line = content.split("\n", 1)[0]
             return "微信支付账单明细" in first_line
         except Exception:
             return False
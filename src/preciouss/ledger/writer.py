@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+from collections.abc import Sequence
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -183,6 +184,7 @@ def write_transactions(
     output_path: str | Path,
     counter_account: str | None = None,
     categorizer: RuleCategorizer | None = None,
+    categories: Sequence[str | None] | None = None,
 ) -> Path:
     """Write a list of intermediate Transactions to a .bean file.
 
@@ -191,6 +193,8 @@ def write_transactions(
         output_path: Path for the output .bean file.
         counter_account: Default counter-account. If None, auto-determined per tx.
         categorizer: Optional RuleCategorizer to auto-categorize transactions.
+        categories: Precomputed categories parallel to ``transactions`` (e.g. from
+            ``RuleCategorizer.categorize_batch``); used instead of ``categorizer``.
 
     Returns:
         Path to the written file.
@@ -198,8 +202,13 @@ def write_transactions(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def category_of(i: int, tx: Transaction) -> str | None:
+        if categories is not None:
+            return categories[i]
+        return categorizer.categorize(tx) if categorizer is not None else None
+
     bean_entries = []
-    for tx in transactions:
+    for i, tx in enumerate(transactions):
         # Build links from metadata
         links = frozenset({tx.metadata["link"]}) if tx.metadata.get("link") else frozenset()
 
@@ -275,7 +284,7 @@ def write_transactions(
                 None,
                 None,
             )
-            cat_account = categorizer.categorize(tx) if categorizer else None
+            cat_account = category_of(i, tx)
             counter = cat_account or counter_account or get_expense_account_for_type(tx.tx_type)
             meta = new_metadata("<preciouss>", 0)
             if tx.reference_id:
@@ -301,9 +310,7 @@ def write_transactions(
             )
         else:
             # Standard 2-posting path
-            cat_account = None
-            if categorizer is not None:
-                cat_account = categorizer.categorize(tx)
+            cat_account = category_of(i, tx)
             effective_account = cat_account or counter_account
             bean_tx = transaction_to_bean(tx, effective_account)
         bean_entries.append(bean_tx)
@@ -311,10 +318,10 @@ def write_transactions(
     # Sort by date
     bean_entries.sort(key=lambda e: e.date)
 
+    # Render the whole file first and write it in one call
+    body = "".join(f"{printer.format_entry(entry)}\n" for entry in bean_entries)
     with open(output_path, "w", encoding="utf-8") as f:
-        for entry in bean_entries:
-            f.write(printer.format_entry(entry))
-            f.write("\n")
+        f.write(body)
 
     return output_path
 
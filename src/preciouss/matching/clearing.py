@@ -7,6 +7,7 @@ assigning shared ^clr-NNNNNN links to related transactions.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from preciouss.importers.base import PrecioussImporter, Transaction
@@ -33,13 +34,13 @@ def _is_terminal_expense(tx: Transaction) -> bool:
 
 def assign_clearing_links(
     transactions: list[Transaction],
-    importer_map: dict[int, PrecioussImporter],
+    importers: Sequence[PrecioussImporter],
 ) -> ClearingStats:
     """Assign ^clr-NNNNNN links via DFS from terminal expenses.
 
     Args:
         transactions: All extracted transactions (flat list across importers).
-        importer_map: Mapping from transaction index → importer instance.
+        importers: Importer of each transaction, parallel to ``transactions``.
 
     Returns:
         Statistics about the linking process.
@@ -66,7 +67,7 @@ def assign_clearing_links(
         tx.metadata["link"] = link_name
         total_linked += 1
 
-        matched_any = _dfs_propagate(tx, transactions, importer_map, counter_index)
+        matched_any = _dfs_propagate(i, transactions, importers, counter_index)
         if matched_any:
             total_linked += matched_any
         else:
@@ -80,14 +81,15 @@ def assign_clearing_links(
 
 
 def _dfs_propagate(
-    seed_tx: Transaction,
+    seed_idx: int,
     transactions: list[Transaction],
-    importer_map: dict[int, PrecioussImporter],
+    importers: Sequence[PrecioussImporter],
     counter_index: defaultdict[str, list[int]],
 ) -> int:
     """DFS upward through clearing chain, returning count of newly linked transactions."""
     linked_count = 0
-    current = seed_tx
+    current_idx = seed_idx
+    current = transactions[seed_idx]
     link_name = current.metadata["link"]
 
     while True:
@@ -106,27 +108,20 @@ def _dfs_propagate(
 
         candidates = [transactions[idx] for idx in candidate_indices]
 
-        # Find the importer for the current tx to use its matcher
-        # We need to find current tx's index; look up by identity
-        current_idx = None
-        for idx, tx in enumerate(transactions):
-            if tx is current:
-                current_idx = idx
-                break
-
-        if current_idx is None:
-            break
-
-        importer = importer_map.get(current_idx)
-        if importer is None:
-            break
-
+        # Use the current tx's importer for its matcher
+        importer = importers[current_idx]
         matched = importer.match_clearing(current, candidates)
         if matched is None:
             break
 
         matched.metadata["link"] = link_name
         linked_count += 1
+        # Carry the matched candidate's index forward (by identity: Transactions are
+        # dataclasses and compare by value)
+        next_idx = next((i for i, tx in zip(candidate_indices, candidates) if tx is matched), None)
+        if next_idx is None:
+            break
+        current_idx = next_idx
         current = matched
 
     return linked_count
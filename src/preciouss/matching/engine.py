@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import timedelta
+from decimal import Decimal
+from operator import itemgetter
 
 from rapidfuzz import fuzz
 
@@ -28,6 +33,11 @@ class MatchingOutput:
     unmatched: list[Transaction] = field(default_factory=list)
 
 
+# Bank-side mentions of a payment platform (intermediary phase)
+_PLATFORM_KEYWORDS = ("支付宝", "财付通", "微信", "alipay", "wechat", "tenpay")
+_PLATFORM_RE = re.compile("|".join(map(re.escape, _PLATFORM_KEYWORDS)))
+
+
 class MatchingEngine:
     """Three-phase transaction matching engine.
 
@@ -125,35 +135,34 @@ class MatchingEngine:
             else:
                 bank_txs.append((i, tx))
 
+        # Only bank transactions that mention a payment platform can match; test each
+        # one once, then bucket the rest by (currency, absolute amount) so a platform
+        # transaction only visits same-amount candidates, in original order
+        bank_index = _amount_index(
+            (bi, btx) for bi, btx in bank_txs if _PLATFORM_RE.search(_match_text(btx).lower())
+        )
+
         for pi, ptx in platform_txs:
             if pi in matched_indices:
                 continue
-            for bi, btx in bank_txs:
+            for bi, btx in bank_index.get(_amount_key(ptx), ()):
                 if bi in matched_indices:
                     continue
-                # Check: same amount (absolute), close dates, payee contains platform name
-                if abs(ptx.amount) != abs(btx.amount):
-                    continue
-                if ptx.currency != btx.currency:
-                    continue
+                # Amount and platform mention are guaranteed by bank_index; check the date
                 date_diff = abs(ptx.date - btx.date)
                 if date_diff > self.date_tolerance:
                     continue
-                # Check if the bank transaction mentions the platform
-                btx_text = f"{btx.payee} {btx.narration}".lower()
-                platform_keywords = ["支付宝", "财付通", "微信", "alipay", "wechat", "tenpay"]
-                if any(kw in btx_text for kw in platform_keywords):
-                    matches.append(
-                        MatchResult(
-                            tx_a=ptx,
-                            tx_b=btx,
-                            match_type="intermediary",
-                            confidence=0.9,
-                        )
+                matches.append(
+                    MatchResult(
+                        tx_a=ptx,
+                        tx_b=btx,
+                        match_type="intermediary",
+                        confidence=0.9,
                     )
-                    matched_indices.add(pi)
-                    matched_indices.add(bi)
-                    break
+                )
+                matched_indices.add(pi)
+                matched_indices.add(bi)
+                break
 
         remaining = [tx for i, tx in enumerate(transactions) if i not in matched_indices]
         return matches, remaining
@@ -164,35 +173,30 @@ class MatchingEngine:
         """Phase 3: Fuzzy matching by amount + date + payee similarity."""
         matches = []
         matched_indices: set[int] = set()
-        n = len(transactions)
+        # Amount and currency must match exactly, so only same-bucket pairs are compared
+        amount_index = _amount_index(enumerate(transactions))
+        texts = [_match_text(tx) for tx in transactions]
 
-        for i in range(n):
+        for i, tx_a in enumerate(transactions):
             if i in matched_indices:
                 continue
-            for j in range(i + 1, n):
+            bucket = amount_index[_amount_key(tx_a)]
+            # Later transactions only (j > i); buckets hold indices in ascending order
+            for j, tx_b in bucket[bisect_right(bucket, i, key=itemgetter(0)) :]:
                 if j in matched_indices:
                     continue
-                tx_a, tx_b = transactions[i], transactions[j]
 
                 # Must be from different sources
                 if tx_a.source_account == tx_b.source_account:
                     continue
 
-                # Amount must match exactly (absolute value)
-                if abs(tx_a.amount) != abs(tx_b.amount):
-                    continue
-                if tx_a.currency != tx_b.currency:
-                    continue
-
                 # Date within tolerance
                 date_diff = abs(tx_a.date - tx_b.date)
                 if date_diff > self.date_tolerance:
                     continue
 
                 # Payee similarity
-                payee_a = f"{tx_a.payee} {tx_a.narration}"
-                payee_b = f"{tx_b.payee} {tx_b.narration}"
-                similarity = fuzz.token_sort_ratio(payee_a, payee_b) / 100.0
+                similarity = fuzz.token_sort_ratio(texts[i], texts[j]) / 100.0
 
                 if similarity >= self.fuzzy_threshold:
                     matches.append(
@@ -209,3 +213,21 @@ class MatchingEngine:
 
         remaining = [tx for i, tx in enumerate(transactions) if i not in matched_indices]
         return matches, remaining
+
+
+def _match_text(tx: Transaction) -> str:
+    return f"{tx.payee} {tx.narration}"
+
+
+def _amount_key(tx: Transaction) -> tuple[str, Decimal]:
+    return tx.currency, abs(tx.amount)
+
+
+def _amount_index(
+    indexed: Iterable[tuple[int, Transaction]],
+) -> dict[tuple[str, Decimal], list[tuple[int, Transaction]]]:
+    """Group (index, tx) pairs by currency and absolute amount, keeping their order."""
+    index: dict[tuple[str, Decimal], list[tuple[int, Transaction]]] = {}
+    for i, tx in indexed:
+        index.setdefault(_amount_key(tx), []).append((i, tx))
+    return index
@@ -1,12 +1,14 @@
 """Tests for ALDI JSON importer."""
 
+import re
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
+from unittest.mock import patch
 
 from beancount.loader import load_string
 
-from preciouss.importers.aldi import AldiImporter, AldiItemCategorizer
+from preciouss.importers.aldi import AldiImporter, AldiItemCategorizer, _item_keyword_automaton
 from preciouss.importers.base import Transaction
 from preciouss.ledger.writer import (
     group_items_by_category,
@@ -62,6 +64,40 @@ class TestIdentify:
         importer = AldiImporter()
         assert not importer.identify(f)
 
+    def test_identify_skips_parse_without_order_code(self, tmp_path):
+        """JSON without an "orderCode" key is rejected before it is parsed."""
+        f = tmp_path / "other.json"
+        f.write_text('{"orders": [{"store": "ALDI奥乐齐(test)"}]}', encoding="utf-8")
+        importer = AldiImporter()
+        with (
+            patch("preciouss.importers.aldi.json.loads") as json_loads,
+            patch("preciouss.importers.aldi._HAS_ORJSON", False),
+        ):
+            assert not importer.identify(f)
+        json_loads.assert_not_called()
+
+    def test_identify_rejects_empty_file(self, tmp_path):
+        """A zero-byte file cannot be memory-mapped; identify() returns False."""
+        f = tmp_path / "empty.json"
+        f.touch()
+        importer = AldiImporter()
+        assert not importer.identify(f)
+
+    def test_identify_without_orjson(self):
+        """The stdlib json fallback identifies the fixture when orjson is absent."""
+        importer = AldiImporter()
+        with patch("preciouss.importers.aldi._HAS_ORJSON", False):
+            assert importer.identify(FIXTURES / "aldi_sample.json")
+
+    def test_identify_rejects_bom_without_orjson(self, tmp_path):
+        """A BOM-prefixed export, which extract() cannot read, is rejected either way."""
+        f = tmp_path / "bom.json"
+        f.write_bytes(b"\xef\xbb\xbf" + (FIXTURES / "aldi_sample.json").read_bytes())
+        importer = AldiImporter()
+        assert not importer.identify(f)
+        with patch("preciouss.importers.aldi._HAS_ORJSON", False):
+            assert not importer.identify(f)
+
 
 # --- Extract ---
 
@@ -144,6 +180,36 @@ class TestExtract:
         txns = importer.extract(f)
         assert len(txns) == 0
 
+    def test_price_and_amount_strings(self):
+        """Prices, discount and amounts render exactly as in the fixture's JSON text."""
+        importer = AldiImporter()
+        txns = importer.extract(FIXTURES / "aldi_sample.json")
+        prices = [[item["price"] for item in tx.metadata["aldi_items"]] for tx in txns]
+        assert prices == [
+            ["17.9", "9.9", "14.9", "9.9", "6.9", "5.9", "9.9", "9.5"],
+            ["10.9", "19.9", "7.5", "1.9", "5.9"],
+            ["14.9", "12.9", "9.9", "5.9", "4.7"],
+        ]
+        assert txns[2].metadata["aldi_discount"] == "9.9"
+        assert [str(tx.amount) for tx in txns] == ["-85.7", "-46.1", "-48.3"]
+
+    def test_price_keeps_json_precision(self, tmp_path):
+        """Decimals are parsed from the JSON text, so trailing zeros are kept."""
+        f = tmp_path / "aldi.json"
+        f.write_text(
+            '{"orders": [{"orderCode": "123", "store": "ALDI奥乐齐(test)",'
+            '"date": "2026-01-01", "time": "10:00", "paymentAmount": 12.90,'
+            '"productAmount": 12.90, "promotionAmount": 0.00, "channel": "门店",'
+            '"products": [{"name": "test", "num": 1, "price": 12.90}],'
+            '"orderStatusName": "已完成"}]}',
+            encoding="utf-8",
+        )
+        importer = AldiImporter()
+        tx = importer.extract(f)[0]
+        assert tx.metadata["aldi_items"][0]["price"] == "12.90"
+        assert tx.amount == Decimal("-12.90")
+        assert "aldi_discount" not in tx.metadata
+
     def test_total_verification(self):
         """sum(item prices) should match productAmount for no-discount orders."""
         importer = AldiImporter()
@@ -185,6 +251,30 @@ class TestItemCategorizer:
         cat = AldiItemCategorizer()
         assert cat.categorize("ALDI男士棉拖鞋") == "Expenses:Shopping:Clothing"
 
+    def test_earlier_pattern_wins_regardless_of_position(self):
+        """A keyword from an earlier pattern wins even if a later one occurs first."""
+        cat = AldiItemCategorizer()
+        assert cat.categorize("鱼形湿巾 10片") == "Expenses:Shopping:DailyGoods"
+        assert cat.categorize("牛肉味关东煮") == "Expenses:Food:Restaurant"
+
+    def test_non_literal_pattern_falls_back_to_regex(self):
+        """Patterns using regex syntax are matched as regexes, not as literal keywords."""
+        categories = [
+            (re.compile(r"湿巾"), "Expenses:Shopping:DailyGoods"),
+            (re.compile(r"咖啡(豆|粉)"), "Expenses:Food:Coffee"),
+        ]
+        _item_keyword_automaton.cache_clear()
+        try:
+            with patch("preciouss.importers.aldi.ALDI_ITEM_CATEGORIES", categories):
+                cat = AldiItemCategorizer()
+                assert cat.categorize("意式咖啡豆 500g") == "Expenses:Food:Coffee"
+                assert cat.categorize("卫生湿巾 80片") == "Expenses:Shopping:DailyGoods"
+                assert cat.categorize("咖啡(豆|粉)") == "Expenses:Food:Grocery"
+        finally:
+            _item_keyword_automaton.cache_clear()
+        # The shipped patterns are all literal keywords and use the automaton
+        assert _item_keyword_automaton() is not None
+
     def test_default_category(self):
         """Unknown items should default to Grocery."""
         cat = AldiItemCategorizer()
@@ -1,9 +1,10 @@
 """Tests for Alipay importer."""
 
+from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
-from preciouss.importers.alipay import AlipayImporter
+from preciouss.importers.alipay import AlipayImporter, _parse_datetime
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -53,6 +54,16 @@ def test_account_name():
     assert importer.account_name() == "Assets:MyAlipay"
 
 
+def test_parse_datetime_formats():
+    """Both separators parse; non-padded fields still go through strptime."""
+    assert _parse_datetime("2024-01-15 12:30:05") == datetime(2024, 1, 15, 12, 30, 5)
+    assert _parse_datetime("2024/01/15 12:30:05") == datetime(2024, 1, 15, 12, 30, 5)
+    assert _parse_datetime("2024-1-5 9:05:00") == datetime(2024, 1, 5, 9, 5)
+    assert _parse_datetime("2024-01-15T12:30:05") is None
+    assert _parse_datetime("2024-13-15 12:30:05") is None
+    assert _parse_datetime("") is None
+
+
 class TestMerchantClearing:
     """Test that known merchant payees route to clearing accounts."""
 
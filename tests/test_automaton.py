@@ -0,0 +1,52 @@
+"""Tests for the Aho-Corasick keyword automaton."""
+
+import random
+
+from preciouss.categorize.automaton import KeywordAutomaton
+
+
+def _linear_first(keywords: list[str], text: str) -> int | None:
+    return next((i for i, kw in enumerate(keywords) if kw in text), None)
+
+
+def test_first_returns_lowest_rank_not_leftmost():
+    """Earlier keywords win even when a later keyword occurs earlier in the text."""
+    automaton = KeywordAutomaton(["充电宝", "充电", "来电"])
+    assert automaton.first("来电科技 共享充电宝") == 0
+    assert automaton.first("电动车充电") == 1
+    assert automaton.first("来电") == 2
+
+
+def test_first_no_match():
+    """Texts containing no keyword return None."""
+    automaton = KeywordAutomaton(["星巴克", "coffee"])
+    assert automaton.first("完全未知的商户") is None
+    assert automaton.first("") is None
+
+
+def test_overlapping_suffix_keywords():
+    """Keywords that are suffixes of other keywords are found via failure links."""
+    automaton = KeywordAutomaton(["华为一卡通", "一卡通", "卡通"])
+    assert automaton.first("华为一卡通充值") == 0
+    assert automaton.first("长安一卡通") == 1
+    assert automaton.first("卡通人物") == 2
+
+
+def test_matches_linear_scan():
+    """Randomized check against the plain `kw in text` loop."""
+    rng = random.Random(0)
+    for _ in range(500):
+        keywords = [
+            "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+        assert KeywordAutomaton(keywords).first(text) == _linear_first(keywords, text)
+
+
+def test_empty_keyword_matches_everything():
+    """An empty keyword behaves like `"" in text`: it matches any text."""
+    automaton = KeywordAutomaton(["abc", "", "b"])
+    assert automaton.first("xbx") == 1
+    assert automaton.first("abc") == 0
+    assert KeywordAutomaton([""]).first("") == 0
@@ -0,0 +1,74 @@
+"""Tests for the shared importer base: encoding detection and CSV reading."""
+
+import os
+
+from preciouss.importers.base import CsvImporter, Transaction, _detect_encoding
+
+SAMPLE_TEXT = (
+    "交易时间,交易类型,交易对方,商品,收/支,金额(元),支付方式,当前状态\n"
+    "2024-01-01 10:00:00,商户消费,星巴克,拿铁咖啡,支出,¥35.00,招商银行信用卡(0913),支付成功\n"
+)
+
+
+class TestDetectEncoding:
+    def test_utf8_bom(self):
+        assert _detect_encoding(b"\xef\xbb\xbf" + SAMPLE_TEXT.encode("utf-8")) == "UTF-8-SIG"
+
+    def test_utf16_bom(self):
+        raw = b"\xff\xfe" + SAMPLE_TEXT.encode("utf-16-le")
+        assert _detect_encoding(raw) == "UTF-16"
+
+    def test_pure_ascii(self):
+        assert _detect_encoding(b"date,amount\n2024-01-01,35.00\n") == "ascii"
+
+    def test_hz_marker_is_not_treated_as_ascii(self):
+        # "~{" opens an HZ-GB-2312 run, so pure-ASCII bytes still go to chardet
+        assert _detect_encoding(b"~{<:Ky2;S{#,~}") == "HZ-GB-2312"
+
+    def test_gb18030(self):
+        raw = SAMPLE_TEXT.encode("gb18030")
+        # chardet 5 reports the GB2312 subset, later releases GB18030
+        assert _detect_encoding(raw) in ("GB2312", "GB18030")
+
+    def test_gb18030_spanning_several_chunks(self):
+        raw = SAMPLE_TEXT.encode("gb18030") * 200  # > 8 KB, fed to chardet incrementally
+        assert _detect_encoding(raw) in ("GB2312", "GB18030")
+
+    def test_empty(self):
+        assert _detect_encoding(b"") == "ascii"
+
+
+class _RowsImporter(CsvImporter):
+    """Minimal CSV importer; any parsed row is a test failure."""
+
+    def _parse_row(self, row: dict[str, str]) -> Transaction | None:
+        raise AssertionError(f"unexpected row {row!r}")
+
+    def account_name(self) -> str:
+        return "Assets:Test"
+
+
+class TestCsvExtract:
+    def test_empty_file_returns_no_transactions(self, tmp_path):
+        csv_path = tmp_path / "empty.csv"
+        csv_path.write_bytes(b"")
+        assert _RowsImporter().extract(csv_path) == []
+
+    def test_rewritten_file_is_read_again(self, tmp_path):
+        """The decode cache is keyed on mtime and size, so edits are picked up."""
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("old,1\n")
+        importer = _RowsImporter()
+        assert importer._read_file(csv_path) == "old,1\n"
+
+        # Same size: only the new mtime tells the cache the file changed
+        st = csv_path.stat()
+        csv_path.write_text("new,2\n")
+        os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert importer._read_file(csv_path) == "new,2\n"
+
+        # Different size with the mtime put back: the size alone invalidates
+        st = csv_path.stat()
+        csv_path.write_text("newer,3\n")
+        os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert importer._read_file(csv_path) == "newer,3\n"
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from preciouss.categorize.rules import RuleCategorizer
+from preciouss.categorize.rules import DEFAULT_RULES, RuleCategorizer
 from preciouss.importers.base import Transaction
 
 
@@ -50,6 +50,74 @@ def test_custom_rules_override():
     assert categorizer.categorize(_make_tx("测试商户")) == "Expenses:Test"
 
 
+def test_default_rules_not_copied_or_mutated():
+    """Without user rules the defaults are shared read-only; user rules get a merged copy."""
+    default = RuleCategorizer()
+    assert default.keyword_rules == DEFAULT_RULES
+
+    RuleCategorizer(keyword_rules={"测试商户": "Expenses:Test"})
+    assert "测试商户" not in DEFAULT_RULES
+    assert "测试商户" not in RuleCategorizer().keyword_rules
+
+
+def test_custom_regex_rules_before_defaults():
+    """User regex rules are tried before default regex rules, case-insensitively."""
+    categorizer = RuleCategorizer(regex_rules=[(r"BONUS|工资", "Income:Bonus")])
+
+    assert categorizer.categorize(_make_tx("某公司", "年终bonus")) == "Income:Bonus"
+    assert categorizer.categorize(_make_tx("某公司", "工资发放")) == "Income:Bonus"
+    assert categorizer.categorize(_make_tx("某商户", "退款")) == "Income:Refund"
+
+
+def test_shadowed_keywords_pruned():
+    """Keywords containing an earlier keyword are dropped without changing results."""
+    categorizer = RuleCategorizer(keyword_rules={"STARBUCKS": "Expenses:Test"})
+
+    assert "万科物业" not in categorizer._automaton.keywords
+    assert categorizer.categorize(_make_tx("万科物业")) == "Expenses:Housing:PropertyFee"
+    # "STARBUCKS" lowercases to a duplicate of the earlier "starbucks" rule
+    assert categorizer.categorize(_make_tx("Starbucks")) == "Expenses:Food:Coffee"
+
+
+def test_jd_raw_category_exact_match():
+    """An exact JD raw_category decides the category before keyword matching."""
+    categorizer = RuleCategorizer()
+
+    tx = _make_tx("京东商城", "数码电器 充电器", raw_category="生活服务")
+    assert categorizer.categorize(tx) == "Expenses:Shopping:DailyGoods"
+    tx = _make_tx("京东商城", "某商品", raw_category="食品酒饮")
+    assert categorizer.categorize(tx) == "Expenses:Food:Grocery"
+    # Still matched as a keyword inside free text
+    assert categorizer.categorize(_make_tx("家用电器专卖")) == "Expenses:Shopping:Electronics"
+
+
+def test_jd_raw_category_user_override():
+    """User keyword rules for JD categories also apply to the exact lookup."""
+    categorizer = RuleCategorizer(keyword_rules={"生活服务": "Expenses:Test"})
+    tx = _make_tx("京东商城", "某商品", raw_category="生活服务")
+    assert categorizer.categorize(tx) == "Expenses:Test"
+
+
+def test_regex_rules_case_insensitive():
+    """Uppercase patterns and escapes still match the lowercased text."""
+    categorizer = RuleCategorizer(regex_rules=[(r"ORDER\d+", "Expenses:Test")])
+
+    assert categorizer.categorize(_make_tx("某银行", "ATM取款")) == "Expenses:Transfer"
+    assert categorizer.categorize(_make_tx("某商户", "Order123")) == "Expenses:Test"
+    assert categorizer.categorize(_make_tx("某商户", "Order abc")) is None
+
+
+def test_regex_rules_not_mergeable():
+    """Rules with backreferences or inline flags still match when the prefilter is off."""
+    categorizer = RuleCategorizer(regex_rules=[(r"(\d)\1{3}", "Expenses:Test")])
+    assert categorizer._regex_prefilter is None
+    assert categorizer.categorize(_make_tx("某商户", "靓号8888")) == "Expenses:Test"
+    assert categorizer.categorize(_make_tx("某商户", "工资")) == "Income:Salary"
+
+    categorizer = RuleCategorizer(regex_rules=[(r"(?s)a.b", "Expenses:Test")])
+    assert categorizer.categorize(_make_tx("a\nb")) == "Expenses:Test"
+
+
 def test_no_match_returns_none():
     """Unknown merchants return None."""
     categorizer = RuleCategorizer()
@@ -156,3 +224,21 @@ def test_group_collection_income():
     categorizer = RuleCategorizer()
     tx = _make_tx("李四", "群收款", "群收款", tx_type="income")
     assert categorizer.categorize(tx) == "Income:Transfer"
+
+
+# --- Batch categorization ---
+
+
+def test_categorize_batch_matches_single():
+    """categorize_batch returns the same results as per-transaction categorize."""
+    categorizer = RuleCategorizer()
+    txns = [
+        _make_tx("星巴克"),
+        _make_tx("张三", "转账", "转账", tx_type="expense"),
+        _make_tx("星巴克"),
+        _make_tx("张三", "转账", "转账", tx_type="income"),
+        _make_tx("完全未知的商户"),
+    ]
+    assert categorizer.categorize_batch(txns) == [categorizer.categorize(tx) for tx in txns]
+    assert categorizer.categorize_batch(txns)[3] == "Income:Transfer"
+    assert categorizer.categorize_batch([]) == []
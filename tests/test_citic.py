@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
-from preciouss.importers.citic import CiticCreditPdfImporter
+from preciouss.importers.citic import _PARALLEL_LOCK, CiticCreditPdfImporter, _is_tx_date
 
 # ---------------------------------------------------------------------------
 # Sample data (mirrors a real billing cycle page)
@@ -32,6 +34,21 @@ SAMPLE_PAGES = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# _is_tx_date tests
+# ---------------------------------------------------------------------------
+
+
+def test_is_tx_date_formats():
+    assert _is_tx_date("20251209")
+    assert _is_tx_date("2021-03-05")
+    assert not _is_tx_date("2025120")
+    assert not _is_tx_date("2021/03/05")
+    assert not _is_tx_date("2021-3-5")
+    assert not _is_tx_date("CNY")
+    assert not _is_tx_date("106.19")
+
+
 # ---------------------------------------------------------------------------
 # _parse_row tests
 # ---------------------------------------------------------------------------
@@ -215,3 +232,91 @@ def test_identify_rejects_wrong_bank(tmp_path):
     with patch("pdfplumber.open", return_value=mock_pdf):
         importer = CiticCreditPdfImporter()
         assert not importer.identify(pdf_path)
+
+
+# ---------------------------------------------------------------------------
+# _read_pdf() tests (mock pdfplumber.open)
+# ---------------------------------------------------------------------------
+
+
+def _make_mock_multipage_pdf(n_pages: int):
+    """Build a mock PDF whose page i holds one transaction row dated 202501<i>."""
+    pages = []
+    for i in range(n_pages):
+        page = MagicMock()
+        page.extract_text.return_value = f"page {i}"
+        page.extract_words.return_value = [
+            {"top": 100, "x0": 10, "text": f"202501{i + 1:02d}"},
+            {"top": 100, "x0": 200, "text": f"商户{i}"},
+            {"top": 100, "x0": 400, "text": "CNY"},
+            {"top": 100, "x0": 420, "text": f"{i}.00"},
+        ]
+        pages.append(page)
+    mock_ctx = MagicMock()
+    mock_ctx.__enter__.return_value.pages = pages
+    return mock_ctx
+
+
+def test_read_pdf_parallel_matches_serial(tmp_path):
+    """Multi-page statements are read in worker chunks, in page order, same as serially."""
+    pdf_path = tmp_path / "citic.pdf"
+    pdf_path.touch()
+    mock_pdf = _make_mock_multipage_pdf(7)
+    contexts = []
+
+    def in_process_pool(max_workers, mp_context):
+        # Run the worker function on threads so the pdfplumber mock stays in effect
+        contexts.append(mp_context.get_start_method())
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    with patch("pdfplumber.open", return_value=mock_pdf):
+        with patch("preciouss.importers.citic._PARALLEL_MIN_PAGES", 100):
+            serial = CiticCreditPdfImporter._read_pdf(pdf_path)
+        with (
+            patch("preciouss.importers.citic.ProcessPoolExecutor", in_process_pool),
+            patch("preciouss.importers.citic._available_cpus", return_value=3),
+        ):
+            parallel = CiticCreditPdfImporter._read_pdf(pdf_path)
+
+    assert contexts and contexts[0] != "fork"
+    assert [p["text"] for p in parallel] == [f"page {i}" for i in range(7)]
+    assert parallel == serial
+    assert parallel[6]["table"] == [["20250107", "", "", "商户6", "CNY 6.00", ""]]
+
+
+def _read_without_pool(pdf_path, n_cpus=3):
+    """Read a 7-page mock statement, failing if a process pool is started."""
+    with (
+        patch("pdfplumber.open", return_value=_make_mock_multipage_pdf(7)),
+        patch("preciouss.importers.citic.ProcessPoolExecutor") as pool_cls,
+        patch("preciouss.importers.citic._available_cpus", return_value=n_cpus),
+    ):
+        pages = CiticCreditPdfImporter._read_pdf(pdf_path)
+    pool_cls.assert_not_called()
+    return pages
+
+
+def test_read_pdf_single_cpu_reads_serially(tmp_path):
+    pages = _read_without_pool(tmp_path / "citic.pdf", n_cpus=1)
+    assert [p["text"] for p in pages] == [f"page {i}" for i in range(7)]
+
+
+def test_read_pdf_concurrent_read_stays_serial(tmp_path):
+    """While another statement holds the pool, further reads do not start their own."""
+    with _PARALLEL_LOCK:
+        pages = _read_without_pool(tmp_path / "citic.pdf")
+    assert [p["text"] for p in pages] == [f"page {i}" for i in range(7)]
+
+
+def test_read_pdf_broken_pool_falls_back_to_serial(tmp_path):
+    """A pool that cannot run its workers (e.g. no __main__ guard) is not fatal."""
+    pool = MagicMock()
+    pool.__enter__.return_value.map.side_effect = BrokenProcessPool("worker died")
+    with (
+        patch("pdfplumber.open", return_value=_make_mock_multipage_pdf(7)),
+        patch("preciouss.importers.citic.ProcessPoolExecutor", return_value=pool),
+        patch("preciouss.importers.citic._available_cpus", return_value=3),
+    ):
+        pages = CiticCreditPdfImporter._read_pdf(tmp_path / "citic.pdf")
+    assert [p["text"] for p in pages] == [f"page {i}" for i in range(7)]
+    assert not _PARALLEL_LOCK.locked()
@@ -46,7 +46,7 @@ def _run_clearing(transactions: list[Transaction], importers=None):
     """Helper: run assign_clearing_links with a stub importer for all txns."""
     imp = _StubImporter()
     if importers is None:
-        importers = {i: imp for i in range(len(transactions))}
+        importers = [imp] * len(transactions)
     return assign_clearing_links(transactions, importers)
 
 
@@ -1,10 +1,13 @@
 """Tests for CLI commands."""
 
+from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
 from click.testing import CliRunner
 
-from preciouss.cli import main
+from preciouss.cli import _filter_date_range, _importer_output_name, main
+from preciouss.importers.base import Transaction
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -17,6 +20,16 @@ def test_cli_version():
     assert "0.1.0" in result.output
 
 
+def test_cli_subcommand_help_skips_config(tmp_path):
+    """Subcommand --help works without loading (here: an unparseable) config."""
+    bad_config = tmp_path / "config.toml"
+    bad_config.write_text("not [valid toml", encoding="utf-8")
+    runner = CliRunner()
+    result = runner.invoke(main, ["-c", str(bad_config), "status", "--help"])
+    assert result.exit_code == 0
+    assert "Show status" in result.output
+
+
 def test_cli_init(tmp_path):
     """CLI init creates ledger directory."""
     runner = CliRunner()
@@ -84,6 +97,21 @@ def test_cli_import_year_excludes_all(tmp_path, monkeypatch):
     assert "0 transactions imported" in result.output or "Total: 0" in result.output
 
 
+def test_cli_import_skips_unchanged_validation(tmp_path, monkeypatch):
+    """Re-importing the same file reuses the previous clean validation."""
+    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
+    runner.invoke(main, ["init"])
+    args = ["import", str(FIXTURES / "alipay_sample.csv")]
+
+    first = runner.invoke(main, args, catch_exceptions=False)
+    assert "Beancount validation: OK" in first.output
+    assert "(ledger unchanged)" not in first.output
+
+    second = runner.invoke(main, args, catch_exceptions=False)
+    assert "Beancount validation: OK (ledger unchanged)" in second.output
+
+
 def test_cli_import_reinit(tmp_path, monkeypatch):
     """--reinit deletes old ledger and reinitializes before importing."""
     runner = CliRunner()
@@ -115,3 +143,38 @@ def test_cli_import_reinit(tmp_path, monkeypatch):
     # But ledger should be re-created
     assert (ledger_dir / "main.bean").exists()
     assert (ledger_dir / "accounts.bean").exists()
+
+
+def _dated_tx(day: int, month: int = 1) -> Transaction:
+    return Transaction(
+        date=datetime(2024, month, day),
+        amount=Decimal("-1"),
+        currency="CNY",
+        payee=f"P{month}-{day}",
+        narration="test",
+        source_account="Assets:Test",
+    )
+
+
+def test_filter_date_range_sorted():
+    """Date-ordered input is filtered to the half-open range."""
+    txns = [_dated_tx(d) for d in (1, 5, 10, 10, 20, 31)]
+    result = _filter_date_range(txns, datetime(2024, 1, 5), datetime(2024, 1, 20))
+    assert [tx.date.day for tx in result] == [5, 10, 10]
+
+
+def test_filter_date_range_unsorted():
+    """Unordered input is filtered without reordering."""
+    txns = [_dated_tx(d) for d in (20, 1, 10, 5, 31)]
+    result = _filter_date_range(txns, datetime(2024, 1, 5), datetime(2024, 1, 21))
+    assert [tx.date.day for tx in result] == [20, 10, 5]
+
+
+def test_importer_output_name():
+    """Importer class names map to snake_case output file names."""
+    from preciouss.importers.cmb import CmbDebitPdfImporter
+    from preciouss.importers.wechathk import WechatHKImporter
+
+    assert _importer_output_name(CmbDebitPdfImporter()) == "cmb_debit_pdf"
+    assert _importer_output_name(WechatHKImporter()) == "wechat_hk"
+    assert _importer_output_name(type("XYZBankImporter", (), {})()) == "xyz_bank"
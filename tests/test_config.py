@@ -52,3 +52,31 @@ def test_config_model_properties():
     config = Config()
     assert config.ledger_path == Path("./ledger")
     assert config.main_bean_path == Path("./ledger/main.bean")
+
+
+def test_load_config_picks_up_edits_and_env(tmp_path, monkeypatch):
+    """Reloading sees file edits and the current environment, not a stale parse."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text('[general]\nledger_dir = "${LEDGER_DIR}"\n')
+
+    monkeypatch.setenv("LEDGER_DIR", "./first")
+    assert load_config(config_file).general.ledger_dir == "./first"
+    monkeypatch.setenv("LEDGER_DIR", "./second")
+    assert load_config(config_file).general.ledger_dir == "./second"
+
+    config_file.write_text('[general]\nledger_dir = "./edited_ledger"\n')
+    assert load_config(config_file).general.ledger_dir == "./edited_ledger"
+
+
+def test_env_vars_substituted_inside_strings(tmp_path, monkeypatch):
+    """${VAR} references are replaced anywhere in a value; unset ones stay literal."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(
+        '[general]\nledger_dir = "${LEDGER_ROOT}/books"\nmain_file = "${UNSET_VAR}"\n'
+    )
+    monkeypatch.setenv("LEDGER_ROOT", "/data")
+    monkeypatch.delenv("UNSET_VAR", raising=False)
+
+    config = load_config(config_file)
+    assert config.general.ledger_dir == "/data/books"
+    assert config.general.main_file == "${UNSET_VAR}"
@@ -81,3 +81,12 @@ def test_deduplicate_mixed_ref_and_no_ref():
     result = _deduplicate(txns)
     assert len(result) == 4
     assert [tx.payee for tx in result] == ["A", "NoRef", "NoRef-2", "B"]
+
+
+def test_deduplicate_shared_seen_refs_across_batches():
+    """A shared seen_refs set deduplicates later batches against earlier ones."""
+    seen: set[str] = set()
+    first = _deduplicate([_make_tx("REF001", payee="A"), _make_tx(None)], seen)
+    second = _deduplicate([_make_tx("REF001", payee="A-dup"), _make_tx("REF002")], seen)
+    assert [tx.payee for tx in first] == ["A", "Test"]
+    assert [tx.reference_id for tx in second] == ["REF002"]
@@ -0,0 +1,28 @@
+"""Tests for the category taxonomy."""
+
+from preciouss.categorize.taxonomy import (
+    ALL_CATEGORIES,
+    EXPENSE_CATEGORIES,
+    get_all_categories,
+)
+
+
+def test_get_all_categories():
+    """Flat list contains expense leaves followed by income categories."""
+    categories = get_all_categories()
+    assert categories[0] == "Expenses:Food:Restaurant"
+    assert "Expenses:Pet:Medical" in categories
+    assert categories[-1] == "Income:Refund"
+    assert categories == list(ALL_CATEGORIES)
+
+
+def test_get_all_categories_returns_copy():
+    """Callers may mutate the returned list without affecting later calls."""
+    get_all_categories().append("Expenses:Test")
+    assert "Expenses:Test" not in get_all_categories()
+
+
+def test_expense_categories_are_expense_accounts():
+    """The flat expense view holds only full Expenses: account names."""
+    assert "Expenses:Food:Coffee" in EXPENSE_CATEGORIES
+    assert all(c.startswith("Expenses:") for c in EXPENSE_CATEGORIES)
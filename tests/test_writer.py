@@ -201,6 +201,36 @@ def test_counter_account(tmp_path):
     assert "Assets:Bank:CMB" in combined
 
 
+def test_write_transactions_precomputed_categories(tmp_path):
+    """Precomputed categories are used per transaction, in order."""
+    txns = [
+        Transaction(
+            date=datetime(2024, 1, 15),
+            amount=Decimal("-35.00"),
+            currency="CNY",
+            payee="星巴克",
+            narration="咖啡",
+            source_account="Assets:Alipay",
+            tx_type="expense",
+        ),
+        Transaction(
+            date=datetime(2024, 1, 16),
+            amount=Decimal("-12.00"),
+            currency="CNY",
+            payee="未知商户",
+            narration="消费",
+            source_account="Assets:Alipay",
+            tx_type="expense",
+        ),
+    ]
+    output = tmp_path / "test.bean"
+    write_transactions(txns, output, categories=["Expenses:Food:Coffee", None])
+
+    content = output.read_text(encoding="utf-8")
+    assert "Expenses:Food:Coffee" in content
+    assert "Expenses:Uncategorized" in content
+
+
 def test_cross_currency_bridge_validates(tmp_path):
     """WechatHK->Costco clearing bridge (HKD source, CNY counter) passes beancount."""
     tx = Transaction(